@@ -1,4 +1,5 @@
 import os
+import shutil
 import sys
 import tempfile
 
@@ -19,6 +20,21 @@ from wikitools.file_utils import file_tree
 sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
 
 
+def pytest_configure(config):
+    # tests create, rewrite and commit lots of tiny files, which is much faster on a RAM disk if there is one
+    # (xdist workers are handed a directory inside the controller's, so they don't need one of their own)
+    ramdisk = os.environ.get("PYTEST_RAMDISK", "/dev/shm")
+    if config.option.basetemp is None and os.path.isdir(ramdisk):
+        config.option.basetemp = tempfile.mkdtemp(prefix="osu-wiki-tools-", dir=ramdisk)
+        config.ramdisk_basetemp = config.option.basetemp
+
+
+def pytest_unconfigure(config):
+    # unlike the default location, nothing cleans up after old runs here, and the space is taken from memory
+    if hasattr(config, "ramdisk_basetemp"):
+        shutil.rmtree(config.ramdisk_basetemp, ignore_errors=True)
+
+
 def clear_function_cache():
     # exists_case_insensitive and get_canonical_path_casing cache all directory paths
     # during normal execution, the current working directory never changes, but tests use a new temporary directory for each test case
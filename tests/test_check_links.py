@@ -1,106 +1,76 @@
+import pytest
+
 import tests.conftest
 import tests.utils as utils
 
 from wikitools_cli.commands import check_links as link_checker
 
 
-class TestCheckLinks:
-    def test__check_links_all_valid(self, root):
-        article_paths = [
-            'wiki/redirect.yaml',
-            'wiki/Article/en.md',
-            'wiki/Article/pt-br.md',
-            'wiki/Article/zh-tw.md',
-            'wiki/Category1/Article/en.md',
-            'wiki/Category1/Article/fr.md',
-            'wiki/Category1/Article/zh-tw.md',
-            'wiki/Category1/Article/TEMPLATE.md',
-            'news/2023/newspost.md',
-        ]
-
-        utils.create_files(root, *((path, '[good link](/wiki/Article)') for path in article_paths))
-
-        exit_code = link_checker.main("--all")
-        assert exit_code == 0
+ARTICLE_PATHS = (
+    'wiki/redirect.yaml',
+    'wiki/Article/en.md',
+    'wiki/Article/pt-br.md',
+    'wiki/Article/zh-tw.md',
+    'wiki/Category1/Article/en.md',
+    'wiki/Category1/Article/fr.md',
+    'wiki/Category1/Article/zh-tw.md',
+    'wiki/Category1/Article/TEMPLATE.md',
+    'news/2023/newspost.md',
+)
 
-    def test__check_links_all_invalid(self, root):
-        article_paths = [
-            'wiki/redirect.yaml',
-            'wiki/Article/en.md',
-            'wiki/Article/pt-br.md',
-            'wiki/Article/zh-tw.md',
-            'wiki/Category1/Article/en.md',
-            'wiki/Category1/Article/fr.md',
-            'wiki/Category1/Article/zh-tw.md',
-            'wiki/Category1/Article/TEMPLATE.md',
-            'news/2023/newspost.md',
-        ]
+TARGET_PATHS = (
+    'wiki/redirect.yaml',
+    'wiki/Article/en.md',
+    'news/2023/newspost.md',
+)
 
-        utils.create_files(root, *((path, '[bad link](/wiki/Not_an_article)') for path in article_paths))
+GOOD_LINK = '[good link](/wiki/Article)'
+BAD_LINK = '[bad link](/wiki/Not_an_article)'
 
-        exit_code = link_checker.main("--all")
-        assert exit_code == 1
 
-    def test__check_links_all_valid_with_changed_root(self, root):
-        article_paths = [
-            'root/wiki/redirect.yaml',
-            'root/wiki/Article/en.md',
-            'root/wiki/Article/pt-br.md',
-            'root/wiki/Article/zh-tw.md',
-            'root/wiki/Category1/Article/en.md',
-            'root/wiki/Category1/Article/fr.md',
-            'root/wiki/Category1/Article/zh-tw.md',
-            'root/wiki/Category1/Article/TEMPLATE.md',
-            'root/news/2023/newspost.md',
+class TestCheckLinks:
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            {"link": GOOD_LINK, "root": None, "exit_code": 0},
+            {"link": BAD_LINK, "root": None, "exit_code": 1},
+            {"link": GOOD_LINK, "root": "root", "exit_code": 0},
+            {"link": BAD_LINK, "root": "root", "exit_code": 1},
         ]
-
-        utils.create_files(root, *((path, '[good link](/wiki/Article)') for path in article_paths))
-
-        exit_code = link_checker.main("--all", "--root", "root")
-        assert exit_code == 0
-
-    def test__check_links_all_invalid_with_changed_root(self, root):
-        article_paths = [
-            'root/wiki/redirect.yaml',
-            'root/wiki/Article/en.md',
-            'root/wiki/Article/pt-br.md',
-            'root/wiki/Article/zh-tw.md',
-            'root/wiki/Category1/Article/en.md',
-            'root/wiki/Category1/Article/fr.md',
-            'root/wiki/Category1/Article/zh-tw.md',
-            'root/wiki/Category1/Article/TEMPLATE.md',
-            'root/news/2023/newspost.md',
+    )
+    def test__check_links_all(self, root, payload):
+        prefix = payload["root"] + "/" if payload["root"] else ""
+        utils.create_files(root, *((prefix + path, payload["link"]) for path in ARTICLE_PATHS))
+
+        root_args = ("--root", payload["root"]) if payload["root"] else ()
+        exit_code = link_checker.main("--all", *root_args)
+        assert exit_code == payload["exit_code"]
+
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            {"link": GOOD_LINK, "exit_code": 0},
+            {"link": BAD_LINK, "exit_code": 1},
         ]
+    )
+    def test__check_links_all_in_parallel(self, root, payload):
+        utils.create_files(root, *((path, payload["link"]) for path in ARTICLE_PATHS))
 
-        utils.create_files(root, *((path, '[bad link](/wiki/Not_an_article)') for path in article_paths))
-
-        exit_code = link_checker.main("--all", "--root", "root")
-        assert exit_code == 1
+        exit_code = link_checker.main("--all", "--jobs", "2")
+        assert exit_code == payload["exit_code"]
 
     def test__check_specific_target_all_invalid(self, root):
-        article_paths = [
-            'wiki/redirect.yaml',
-            'wiki/Article/en.md',
-            'news/2023/newspost.md',
-        ]
+        utils.create_files(root, *((path, BAD_LINK) for path in TARGET_PATHS))
 
-        utils.create_files(root, *((path, '[bad link](/wiki/Not_an_article)') for path in article_paths))
-
-        for article in article_paths[1:]:
+        for article in TARGET_PATHS[1:]:
             print(article)
             exit_code = link_checker.main("--target", article)
             assert exit_code == 1
 
     def test__check_specific_target_all_valid(self, root):
-        article_paths = [
-            'wiki/redirect.yaml',
-            'wiki/Article/en.md',
-            'news/2023/newspost.md',
-        ]
-
-        utils.create_files(root, *((path, '[good link](/wiki/Article)') for path in article_paths))
+        utils.create_files(root, *((path, GOOD_LINK) for path in TARGET_PATHS))
 
-        for article in article_paths[1:]:
+        for article in TARGET_PATHS[1:]:
             print(article)
             exit_code = link_checker.main("--target", article)
             assert exit_code == 0
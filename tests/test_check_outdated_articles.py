@@ -1,36 +1,131 @@
 from collections import Counter as multiset
+import os
+import pathlib
+import shutil
 import textwrap
+import typing
+
+import py
+import pytest
 
 import tests.conftest
 import tests.utils as utils
 
-from wikitools import article_parser, git_utils, file_utils
+from wikitools import file_utils
 
 from wikitools_cli.commands import check_outdated_articles as outdater
 
 
+# an article and its translations at every nesting level, shared by most of the tests below
+NESTED_ARTICLE_PATHS = (
+    'wiki/Article/en.md',
+    'wiki/Article/fr.md',
+    'wiki/Article/pt-br.md',
+    'wiki/Article/zh-tw.md',
+    'wiki/Category1/Article/en.md',
+    'wiki/Category1/Article/fr.md',
+    'wiki/Category1/Article/pt-br.md',
+    'wiki/Category1/Article/zh-tw.md',
+    'wiki/Category1/Category2/Article/en.md',
+    'wiki/Category1/Category2/Article/fr.md',
+    'wiki/Category1/Category2/Article/pt-br.md',
+    'wiki/Category1/Category2/Article/zh-tw.md',
+    'wiki/Category1/Category2/Category3/Article/en.md',
+    'wiki/Category1/Category2/Category3/Article/fr.md',
+    'wiki/Category1/Category2/Category3/Article/pt-br.md',
+    'wiki/Category1/Category2/Category3/Article/zh-tw.md',
+)
+SINGLE_ARTICLE_PATHS = NESTED_ARTICLE_PATHS[:4]
+TWO_ARTICLE_PATHS = (
+    'wiki/Article/en.md',
+    'wiki/Article2/en.md',
+    'wiki/Article/fr.md',
+    'wiki/Article2/fr.md',
+    'wiki/Article/pt-br.md',
+    'wiki/Article2/pt-br.md',
+    'wiki/Article/zh-tw.md',
+    'wiki/Article2/zh-tw.md',
+)
+
+# the nested articles split by role, since the flow tests check each group separately
+NESTED_ORIGINALS = utils.take(NESTED_ARTICLE_PATHS, "en.md")
+NESTED_CHINESE_TRANSLATIONS = utils.take(NESTED_ARTICLE_PATHS, "zh-tw.md")
+NESTED_OTHER_TRANSLATIONS = utils.remove(NESTED_ARTICLE_PATHS, "en.md", "zh-tw.md")
+
+
+# what a '# Article' translation looks like after being outdated
+OUTDATED_ARTICLE = textwrap.dedent('''
+    ---
+    {tag}: true
+    {hash_tag}: {hash}
+    ---
+
+    # Article
+''').strip()
+
+
+def outdated_fields(commit_hash):
+    return {'tag': outdater.OUTDATED_TRANSLATION_TAG, 'hash_tag': outdater.OUTDATED_HASH_TAG, 'hash': commit_hash}
+
+
+class FlowRepository(typing.NamedTuple):
+    """
+    A repository in the state every full flow test starts from:
+        1. articles are added
+        2. their Chinese translations are outdated
+        3. the English originals are modified
+    """
+
+    path: pathlib.Path
+    commit_hash_1: str
+    commit_hash_2: str
+    # every article as it should look after the outdater is run with --outdated-since commit_hash_2
+    expected_contents: typing.Dict[str, str]
+
+    def copy_to(self, root):
+        # the copy keeps the same commits, so their hashes stay valid
+        shutil.copytree(self.path, root, dirs_exist_ok=True)
+
+
+@pytest.fixture(scope='class')
+def flow_repo(tmp_path_factory):
+    # building the repository takes a dozen git calls, so it's done once and copied into each test's root
+    repo_path = tmp_path_factory.mktemp('flow_repo')
+    curdir = os.getcwd()
+    os.chdir(repo_path)
+    try:
+        utils.set_up_dummy_repo()
+
+        utils.create_files(py.path.local(repo_path), *((path, '# Article') for path in NESTED_ARTICLE_PATHS))
+        utils.stage_all_and_commit("add articles")
+        commit_hash_1 = utils.get_last_commit_hash()
+
+        outdater.outdate_translations(*NESTED_CHINESE_TRANSLATIONS, outdated_hash=commit_hash_1)
+        utils.stage_all_and_commit("outdate chinese translations")
+
+        utils.create_files(py.path.local(repo_path), *(
+            (article_path, '# Article\n\nThis is an article in English.') for article_path in NESTED_ORIGINALS
+        ))
+        utils.stage_all_and_commit("modify english articles")
+        commit_hash_2 = utils.get_last_commit_hash()
+    finally:
+        os.chdir(curdir)
+
+    outdated_since_1 = OUTDATED_ARTICLE.format_map(outdated_fields(commit_hash_1))
+    outdated_since_2 = OUTDATED_ARTICLE.format_map(outdated_fields(commit_hash_2))
+    expected_contents = {
+        **{article: outdated_since_1 for article in NESTED_CHINESE_TRANSLATIONS},
+        **{article: outdated_since_2 for article in NESTED_OTHER_TRANSLATIONS},
+        **{article: '# Article\n\nThis is an article in English.' for article in NESTED_ORIGINALS},
+    }
+
+    return FlowRepository(repo_path, commit_hash_1, commit_hash_2, expected_contents)
+
+
 class TestCheckOutdatedArticles:
     def test__list_modified_translations(self, root):
         utils.set_up_dummy_repo()
-        article_paths = [
-            'wiki/Article/en.md',
-            'wiki/Article/fr.md',
-            'wiki/Article/pt-br.md',
-            'wiki/Article/zh-tw.md',
-            'wiki/Category1/Article/en.md',
-            'wiki/Category1/Article/fr.md',
-            'wiki/Category1/Article/pt-br.md',
-            'wiki/Category1/Article/zh-tw.md',
-            'wiki/Category1/Article/TEMPLATE.md',
-            'wiki/Category1/Category2/Article/en.md',
-            'wiki/Category1/Category2/Article/fr.md',
-            'wiki/Category1/Category2/Article/pt-br.md',
-            'wiki/Category1/Category2/Article/zh-tw.md',
-            'wiki/Category1/Category2/Category3/Article/en.md',
-            'wiki/Category1/Category2/Category3/Article/fr.md',
-            'wiki/Category1/Category2/Category3/Article/pt-br.md',
-            'wiki/Category1/Category2/Category3/Article/zh-tw.md',
-        ]
+        article_paths = [*NESTED_ARTICLE_PATHS, 'wiki/Category1/Article/TEMPLATE.md']
 
         utils.create_files(root, *((path, '') for path in article_paths))
         utils.stage_all_and_commit("initial commit")
@@ -46,24 +141,21 @@ class TestCheckOutdatedArticles:
             *((path, '# Article\n\nCeci est un article en français.') for path in
             utils.take(article_paths, "fr.md"))
         )
-        utils.stage_all_and_commit("add article content")
 
-        modified_translations = outdater.list_modified_translations("HEAD^")
+        # changes are diffed against the working tree, so they don't have to be committed to be listed
+        modified_translations = outdater.list_modified_translations("HEAD")
+
+        assert multiset(modified_translations) == multiset(utils.take(article_paths, "fr.md"))
+
+        utils.stage_all_and_commit("translate articles into french")
+
+        modified_translations = outdater.list_modified_translations("HEAD^...HEAD")
 
         assert multiset(modified_translations) == multiset(utils.take(article_paths, "fr.md"))
 
     def test__list_modified_originals(self, root):
         utils.set_up_dummy_repo()
-        article_paths = [
-            'wiki/Article/en.md',
-            'wiki/Article2/en.md',
-            'wiki/Article/fr.md',
-            'wiki/Article2/fr.md',
-            'wiki/Article/pt-br.md',
-            'wiki/Article2/pt-br.md',
-            'wiki/Article/zh-tw.md',
-            'wiki/Article2/zh-tw.md',
-        ]
+        article_paths = TWO_ARTICLE_PATHS
 
         utils.create_files(root, *((path, '# Article') for path in article_paths))
         utils.stage_all_and_commit("add some articles")
@@ -72,23 +164,30 @@ class TestCheckOutdatedArticles:
             '# Article\n\nThis is an article in English.',
             '# Article\n\nThis is another article in English.',
         ]))
-        utils.stage_all_and_commit("add article content")
 
-        modified_originals = outdater.list_modified_originals("HEAD^")
+        modified_originals = outdater.list_modified_originals("HEAD")
+        assert multiset(modified_originals) == multiset(utils.take(article_paths, "en.md"))
+
+        utils.stage_all_and_commit("modify english articles")
+
+        modified_originals = outdater.list_modified_originals("HEAD^...HEAD")
         assert multiset(modified_originals) == multiset(utils.take(article_paths, "en.md"))
 
+    def test__list_modified_non_ascii_paths(self, root):
+        utils.set_up_dummy_repo()
+        article_paths = ['wiki/Café/en.md', 'wiki/Café/fr.md', 'wiki/Café/zh-tw.md']
+
+        utils.create_files(root, *((path, '# Café') for path in article_paths))
+        utils.stage_all_and_commit("add an article")
+
+        utils.create_files(root, *((path, '# Café\n\nUn café, s\'il vous plaît.') for path in article_paths))
+
+        assert multiset(outdater.list_modified_originals("HEAD")) == multiset(article_paths[:1])
+        assert multiset(outdater.list_modified_translations("HEAD")) == multiset(article_paths[1:])
+
     def test__list_outdated_translations(self, root):
         utils.set_up_dummy_repo()
-        article_paths = [
-            'wiki/Article/en.md',
-            'wiki/Article2/en.md',
-            'wiki/Article/fr.md',
-            'wiki/Article2/fr.md',
-            'wiki/Article/pt-br.md',
-            'wiki/Article2/pt-br.md',
-            'wiki/Article/zh-tw.md',
-            'wiki/Article2/zh-tw.md',
-        ]
+        article_paths = TWO_ARTICLE_PATHS
 
         utils.create_files(root, *((path, '# Article') for path in article_paths))
         utils.stage_all_and_commit("add some articles")
@@ -107,16 +206,7 @@ class TestCheckOutdatedArticles:
 
     def test__outdate_translations(self, root):
         utils.set_up_dummy_repo()
-        article_paths = [
-            'wiki/Article2/en.md',
-            'wiki/Article/en.md',
-            'wiki/Article2/fr.md',
-            'wiki/Article/fr.md',
-            'wiki/Article2/pt-br.md',
-            'wiki/Article/pt-br.md',
-            'wiki/Article2/zh-tw.md',
-            'wiki/Article/zh-tw.md',
-        ]
+        article_paths = TWO_ARTICLE_PATHS
 
         utils.create_files(root, *((path, '# Article') for path in article_paths))
         utils.stage_all_and_commit("add some articles")
@@ -130,39 +220,25 @@ class TestCheckOutdatedArticles:
 
         to_outdate_zh_tw = utils.take(article_paths, "zh-tw.md")
         outdater.outdate_translations(*to_outdate_zh_tw, outdated_hash=commit_hash)
-        outdated_translations = utils.get_changed_files()
+        outdated_translations = utils.get_changed_files("wiki")
         utils.stage_all_and_commit("outdate zh-tw")
 
         assert multiset(outdated_translations) == multiset(to_outdate_zh_tw)
 
         to_outdate_all = utils.remove(article_paths, "en.md")
         outdater.outdate_translations(*to_outdate_all, outdated_hash=commit_hash)
-        outdated_translations = utils.get_changed_files()
+        outdated_translations = utils.get_changed_files("wiki")
         utils.stage_all_and_commit("outdate the rest of the translations")
 
         assert multiset(outdated_translations) == multiset(utils.remove(article_paths, "en.md", "zh-tw.md"))
 
+        expected_content = OUTDATED_ARTICLE.format_map(outdated_fields(commit_hash))
         for article in to_outdate_all:
-            with open(article, "r", encoding='utf-8') as fd:
-                content = fd.read()
-
-            assert content == textwrap.dedent('''
-                ---
-                {}: true
-                {}: {}
-                ---
-
-                # Article
-            ''').strip().format(outdater.OUTDATED_TRANSLATION_TAG, outdater.OUTDATED_HASH_TAG, commit_hash)
+            assert root.join(article).read_text(encoding='utf-8') == expected_content
 
     def test__validate_hashes(self, root):
         utils.set_up_dummy_repo()
-        article_paths = [
-            'wiki/Article/en.md',
-            'wiki/Article/fr.md',
-            'wiki/Article/pt-br.md',
-            'wiki/Article/zh-tw.md',
-        ]
+        article_paths = SINGLE_ARTICLE_PATHS
 
         utils.create_files(root, *((path, '# Article') for path in article_paths))
         utils.stage_all_and_commit("add an article")
@@ -174,342 +250,91 @@ class TestCheckOutdatedArticles:
         outdater.outdate_translations(*article_paths[1:], outdated_hash=commit_hash)
         utils.stage_all_and_commit("outdate translations")
 
-        with open(article_paths[1], "r", encoding='utf-8') as fd:
-            front_matter = article_parser.load_front_matter(fd)
-        front_matter[outdater.OUTDATED_HASH_TAG] = "bogus-commit-hash"
-        article_parser.save_front_matter(article_paths[1], front_matter)
+        # the front matter round trip is covered by the article parser tests, so the result is written directly
+        utils.create_files(root, (article_paths[1], OUTDATED_ARTICLE.format_map(outdated_fields("bogus-commit-hash"))))
         utils.stage_all_and_commit("corrupt hash")
 
         assert multiset(outdater.check_commit_hashes(article_paths[1:])) == multiset(article_paths[1:2])
 
-    def test__full_autofix_flow(self, root):
-        utils.set_up_dummy_repo()
-        article_paths = [
-            'wiki/Article/en.md',
-            'wiki/Article/fr.md',
-            'wiki/Article/pt-br.md',
-            'wiki/Article/zh-tw.md',
-            'wiki/Category1/Article/en.md',
-            'wiki/Category1/Article/fr.md',
-            'wiki/Category1/Article/pt-br.md',
-            'wiki/Category1/Article/zh-tw.md',
-            'wiki/Category1/Category2/Article/en.md',
-            'wiki/Category1/Category2/Article/fr.md',
-            'wiki/Category1/Category2/Article/pt-br.md',
-            'wiki/Category1/Category2/Article/zh-tw.md',
-            'wiki/Category1/Category2/Category3/Article/en.md',
-            'wiki/Category1/Category2/Category3/Article/fr.md',
-            'wiki/Category1/Category2/Category3/Article/pt-br.md',
-            'wiki/Category1/Category2/Category3/Article/zh-tw.md',
-        ]
-
-        utils.create_files(root, *((path, '# Article') for path in article_paths))
-        utils.stage_all_and_commit("add articles")
-        commit_hash_1 = utils.get_last_commit_hash()
-
-        already_outdated_translations = utils.take(article_paths, "zh-tw.md")
-        outdater.outdate_translations(*already_outdated_translations, outdated_hash=commit_hash_1)
-        utils.stage_all_and_commit("outdate chinese translations")
-
-        utils.create_files(root, *(
-            (article_path, '# Article\n\nThis is an article in English.') for article_path in
-            utils.take(article_paths, "en.md")
-        ))
-        utils.stage_all_and_commit("modify english articles")
-        commit_hash_2 = utils.get_last_commit_hash()
+    def test__full_autofix_flow(self, root, flow_repo):
+        flow_repo.copy_to(root)
 
-        exit_code = outdater.main("--base-commit", "HEAD^", "--outdated-since", commit_hash_2, f"{outdater.AUTOFIX_FLAG}")
+        exit_code = outdater.main("--base-commit", "HEAD^", "--outdated-since", flow_repo.commit_hash_2, f"{outdater.AUTOFIX_FLAG}")
 
         assert exit_code == 0
 
-        outdated_translations = utils.get_changed_files()
-
-        non_chinese_translations = utils.remove(article_paths, "en.md", "zh-tw.md")
+        outdated_translations = utils.get_changed_files("wiki")
 
-        assert multiset(outdated_translations) == multiset(non_chinese_translations)
+        assert multiset(outdated_translations) == multiset(NESTED_OTHER_TRANSLATIONS)
 
-        expected_content = textwrap.dedent('''
-            ---
-            {}: true
-            {}: {}
-            ---
-
-            # Article
-        ''').strip()
-
-        for article in already_outdated_translations:
-            with open(article, "r", encoding='utf-8') as fd:
-                content = fd.read()
-
-            assert content == expected_content.format(outdater.OUTDATED_TRANSLATION_TAG, outdater.OUTDATED_HASH_TAG, commit_hash_1)
-
-        for article in outdated_translations:
-            with open(article, "r", encoding='utf-8') as fd:
-                content = fd.read()
-
-            assert content == expected_content.format(outdater.OUTDATED_TRANSLATION_TAG, outdater.OUTDATED_HASH_TAG, commit_hash_2)
-
-        for article in utils.take(article_paths, "en.md"):
-            with open(article, "r", encoding='utf-8') as fd:
-                content = fd.read()
-
-            assert content == '# Article\n\nThis is an article in English.'
-
-        log = git_utils.git("--no-pager", "log", "--pretty=oneline").splitlines()
-
-        assert len(log) == 3
-
-    def test__full_autocommit_flow(self, root):
-        utils.set_up_dummy_repo()
-        article_paths = [
-            'wiki/Article/en.md',
-            'wiki/Article/fr.md',
-            'wiki/Article/pt-br.md',
-            'wiki/Article/zh-tw.md',
-            'wiki/Category1/Article/en.md',
-            'wiki/Category1/Article/fr.md',
-            'wiki/Category1/Article/pt-br.md',
-            'wiki/Category1/Article/zh-tw.md',
-            'wiki/Category1/Category2/Article/en.md',
-            'wiki/Category1/Category2/Article/fr.md',
-            'wiki/Category1/Category2/Article/pt-br.md',
-            'wiki/Category1/Category2/Article/zh-tw.md',
-            'wiki/Category1/Category2/Category3/Article/en.md',
-            'wiki/Category1/Category2/Category3/Article/fr.md',
-            'wiki/Category1/Category2/Category3/Article/pt-br.md',
-            'wiki/Category1/Category2/Category3/Article/zh-tw.md',
-        ]
-
-        utils.create_files(root, *((path, '# Article') for path in article_paths))
-        utils.stage_all_and_commit("add articles")
-        commit_hash_1 = utils.get_last_commit_hash()
+        for article, expected_content in flow_repo.expected_contents.items():
+            assert root.join(article).read_text(encoding='utf-8') == expected_content
 
-        already_outdated_translations = utils.take(article_paths, "zh-tw.md")
-        outdater.outdate_translations(*already_outdated_translations, outdated_hash=commit_hash_1)
-        utils.stage_all_and_commit("outdate chinese translations")
+        assert utils.count_commits() == 3
 
-        utils.create_files(root, *(
-            (article_path, '# Article\n\nThis is an article in English.') for article_path in
-            utils.take(article_paths, "en.md")
-        ))
-        utils.stage_all_and_commit("modify english articles")
-        commit_hash_2 = utils.get_last_commit_hash()
+    def test__full_autocommit_flow(self, root, flow_repo):
+        flow_repo.copy_to(root)
 
-        exit_code = outdater.main("--base-commit", "HEAD^", "--outdated-since", commit_hash_2, f"{outdater.AUTOFIX_FLAG}", f"{outdater.AUTOCOMMIT_FLAG}")
+        exit_code = outdater.main("--base-commit", "HEAD^", "--outdated-since", flow_repo.commit_hash_2, f"{outdater.AUTOFIX_FLAG}", f"{outdater.AUTOCOMMIT_FLAG}")
 
         assert exit_code == 0
 
-        assert commit_hash_2 != utils.get_last_commit_hash()
+        assert flow_repo.commit_hash_2 != utils.get_last_commit_hash()
 
         assert utils.get_changed_files() == []
 
         outdated_translations = outdater.list_modified_translations("HEAD^")
 
-        non_chinese_translations = utils.remove(article_paths, "en.md", "zh-tw.md")
-
-        assert multiset(outdated_translations) == multiset(non_chinese_translations)
+        assert multiset(outdated_translations) == multiset(NESTED_OTHER_TRANSLATIONS)
 
-        expected_content = textwrap.dedent('''
-            ---
-            {}: true
-            {}: {}
-            ---
+        for article, expected_content in flow_repo.expected_contents.items():
+            assert root.join(article).read_text(encoding='utf-8') == expected_content
 
-            # Article
-        ''').strip()
+        assert utils.count_commits() == 4
 
-        for article in already_outdated_translations:
-            with open(article, "r", encoding='utf-8') as fd:
-                content = fd.read()
-
-            assert content == expected_content.format(outdater.OUTDATED_TRANSLATION_TAG, outdater.OUTDATED_HASH_TAG, commit_hash_1)
-
-        for article in outdated_translations:
-            with open(article, "r", encoding='utf-8') as fd:
-                content = fd.read()
-
-            assert content == expected_content.format(outdater.OUTDATED_TRANSLATION_TAG, outdater.OUTDATED_HASH_TAG, commit_hash_2)
-
-        for article in utils.take(article_paths, "en.md"):
-            with open(article, "r", encoding='utf-8') as fd:
-                content = fd.read()
-
-            assert content == '# Article\n\nThis is an article in English.'
-
-        log = git_utils.git("--no-pager", "log", "--pretty=oneline").splitlines()
-
-        assert len(log) == 4
-
-    def test__full_autofix_flow_with_changed_root(self, root):
-        utils.set_up_dummy_repo()
-        article_paths = [
-            'wiki/Article/en.md',
-            'wiki/Article/fr.md',
-            'wiki/Article/pt-br.md',
-            'wiki/Article/zh-tw.md',
-            'wiki/Category1/Article/en.md',
-            'wiki/Category1/Article/fr.md',
-            'wiki/Category1/Article/pt-br.md',
-            'wiki/Category1/Article/zh-tw.md',
-            'wiki/Category1/Category2/Article/en.md',
-            'wiki/Category1/Category2/Article/fr.md',
-            'wiki/Category1/Category2/Article/pt-br.md',
-            'wiki/Category1/Category2/Article/zh-tw.md',
-            'wiki/Category1/Category2/Category3/Article/en.md',
-            'wiki/Category1/Category2/Category3/Article/fr.md',
-            'wiki/Category1/Category2/Category3/Article/pt-br.md',
-            'wiki/Category1/Category2/Category3/Article/zh-tw.md',
-        ]
-
-        utils.create_files(root, *((path, '# Article') for path in article_paths))
-        utils.stage_all_and_commit("add articles")
-        commit_hash_1 = utils.get_last_commit_hash()
-
-        already_outdated_translations = utils.take(article_paths, "zh-tw.md")
-        outdater.outdate_translations(*already_outdated_translations, outdated_hash=commit_hash_1)
-        utils.stage_all_and_commit("outdate chinese translations")
-
-        utils.create_files(root, *(
-            (article_path, '# Article\n\nThis is an article in English.') for article_path in
-            utils.take(article_paths, "en.md")
-        ))
-        utils.stage_all_and_commit("modify english articles")
-        commit_hash_2 = utils.get_last_commit_hash()
+    def test__full_autofix_flow_with_changed_root(self, root, flow_repo):
+        flow_repo.copy_to(root)
 
         cd = file_utils.ChangeDirectory("wiki")
-        exit_code = outdater.main("--root", "..", "--base-commit", "HEAD^", "--outdated-since", commit_hash_2, f"{outdater.AUTOFIX_FLAG}")
+        exit_code = outdater.main("--root", "..", "--base-commit", "HEAD^", "--outdated-since", flow_repo.commit_hash_2, f"{outdater.AUTOFIX_FLAG}")
         del cd
 
         assert exit_code == 0
 
-        outdated_translations = utils.get_changed_files()
-
-        non_chinese_translations = utils.remove(article_paths, "en.md", "zh-tw.md")
+        outdated_translations = utils.get_changed_files("wiki")
 
-        assert multiset(outdated_translations) == multiset(non_chinese_translations)
+        assert multiset(outdated_translations) == multiset(NESTED_OTHER_TRANSLATIONS)
 
-        expected_content = textwrap.dedent('''
-            ---
-            {}: true
-            {}: {}
-            ---
+        for article, expected_content in flow_repo.expected_contents.items():
+            assert root.join(article).read_text(encoding='utf-8') == expected_content
 
-            # Article
-        ''').strip()
+        assert utils.count_commits() == 3
 
-        for article in already_outdated_translations:
-            with open(article, "r", encoding='utf-8') as fd:
-                content = fd.read()
-
-            assert content == expected_content.format(outdater.OUTDATED_TRANSLATION_TAG, outdater.OUTDATED_HASH_TAG, commit_hash_1)
-
-        for article in outdated_translations:
-            with open(article, "r", encoding='utf-8') as fd:
-                content = fd.read()
-
-            assert content == expected_content.format(outdater.OUTDATED_TRANSLATION_TAG, outdater.OUTDATED_HASH_TAG, commit_hash_2)
-
-        for article in utils.take(article_paths, "en.md"):
-            with open(article, "r", encoding='utf-8') as fd:
-                content = fd.read()
-
-            assert content == '# Article\n\nThis is an article in English.'
-
-        log = git_utils.git("--no-pager", "log", "--pretty=oneline").splitlines()
-
-        assert len(log) == 3
-
-    def test__full_autocommit_flow_with_changed_root(self, root):
-        utils.set_up_dummy_repo()
-        article_paths = [
-            'wiki/Article/en.md',
-            'wiki/Article/fr.md',
-            'wiki/Article/pt-br.md',
-            'wiki/Article/zh-tw.md',
-            'wiki/Category1/Article/en.md',
-            'wiki/Category1/Article/fr.md',
-            'wiki/Category1/Article/pt-br.md',
-            'wiki/Category1/Article/zh-tw.md',
-            'wiki/Category1/Category2/Article/en.md',
-            'wiki/Category1/Category2/Article/fr.md',
-            'wiki/Category1/Category2/Article/pt-br.md',
-            'wiki/Category1/Category2/Article/zh-tw.md',
-            'wiki/Category1/Category2/Category3/Article/en.md',
-            'wiki/Category1/Category2/Category3/Article/fr.md',
-            'wiki/Category1/Category2/Category3/Article/pt-br.md',
-            'wiki/Category1/Category2/Category3/Article/zh-tw.md',
-        ]
-
-        utils.create_files(root, *((path, '# Article') for path in article_paths))
-        utils.stage_all_and_commit("add articles")
-        commit_hash_1 = utils.get_last_commit_hash()
-
-        already_outdated_translations = utils.take(article_paths, "zh-tw.md")
-        outdater.outdate_translations(*already_outdated_translations, outdated_hash=commit_hash_1)
-        utils.stage_all_and_commit("outdate chinese translations")
-
-        utils.create_files(root, *(
-            (article_path, '# Article\n\nThis is an article in English.') for article_path in
-            utils.take(article_paths, "en.md")
-        ))
-        utils.stage_all_and_commit("modify english articles")
-        commit_hash_2 = utils.get_last_commit_hash()
+    def test__full_autocommit_flow_with_changed_root(self, root, flow_repo):
+        flow_repo.copy_to(root)
 
         cd = file_utils.ChangeDirectory("wiki")
-        exit_code = outdater.main("--root", "..", "--base-commit", "HEAD^", "--outdated-since", commit_hash_2, f"{outdater.AUTOFIX_FLAG}", f"{outdater.AUTOCOMMIT_FLAG}")
+        exit_code = outdater.main("--root", "..", "--base-commit", "HEAD^", "--outdated-since", flow_repo.commit_hash_2, f"{outdater.AUTOFIX_FLAG}", f"{outdater.AUTOCOMMIT_FLAG}")
         del cd
 
         assert exit_code == 0
 
-        assert commit_hash_2 != utils.get_last_commit_hash()
+        assert flow_repo.commit_hash_2 != utils.get_last_commit_hash()
 
         assert utils.get_changed_files() == []
 
         outdated_translations = outdater.list_modified_translations("HEAD^")
 
-        non_chinese_translations = utils.remove(article_paths, "en.md", "zh-tw.md")
-
-        assert multiset(outdated_translations) == multiset(non_chinese_translations)
-
-        expected_content = textwrap.dedent('''
-            ---
-            {}: true
-            {}: {}
-            ---
-
-            # Article
-        ''').strip()
-
-        for article in already_outdated_translations:
-            with open(article, "r", encoding='utf-8') as fd:
-                content = fd.read()
-
-            assert content == expected_content.format(outdater.OUTDATED_TRANSLATION_TAG, outdater.OUTDATED_HASH_TAG, commit_hash_1)
-
-        for article in outdated_translations:
-            with open(article, "r", encoding='utf-8') as fd:
-                content = fd.read()
-
-            assert content == expected_content.format(outdater.OUTDATED_TRANSLATION_TAG, outdater.OUTDATED_HASH_TAG, commit_hash_2)
-
-        for article in utils.take(article_paths, "en.md"):
-            with open(article, "r", encoding='utf-8') as fd:
-                content = fd.read()
-
-            assert content == '# Article\n\nThis is an article in English.'
+        assert multiset(outdated_translations) == multiset(NESTED_OTHER_TRANSLATIONS)
 
-        log = git_utils.git("--no-pager", "log", "--pretty=oneline").splitlines()
+        for article, expected_content in flow_repo.expected_contents.items():
+            assert root.join(article).read_text(encoding='utf-8') == expected_content
 
-        assert len(log) == 4
+        assert utils.count_commits() == 4
 
     def test__full_autofix_flow_with_invalid_outdated_since(self, root):
         utils.set_up_dummy_repo()
-        article_paths = [
-            'wiki/Article/en.md',
-            'wiki/Article/fr.md',
-            'wiki/Article/pt-br.md',
-            'wiki/Article/zh-tw.md',
-        ]
+        article_paths = SINGLE_ARTICLE_PATHS
 
         utils.create_files(root, *((path, '# Article') for path in article_paths))
         utils.stage_all_and_commit("add articles")
@@ -1,41 +1,37 @@
+import pytest
+
 from wikitools import code_block_parser
 
 
 class TestCodeBlockParser:
-    def test__inline_blocks(self):
-        for line, expected in (
-            ("Empty", []),
-            (
-                "`test`",
-                [code_block_parser.CodeBlock(start=0, end=5)]
-            ),
-            (
-                "`several` `code blocks`",
-                [
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            {"line": "Empty", "blocks": []},
+            {"line": "`test`", "blocks": [code_block_parser.CodeBlock(start=0, end=5)]},
+            {
+                "line": "`several` `code blocks`",
+                "blocks": [
                     code_block_parser.CodeBlock(start=0, end=8),
                     code_block_parser.CodeBlock(start=10, end=22),
                 ]
-            ),
-            (
-                "``block-o``",
-                [code_block_parser.CodeBlock(start=0, end=10)]
-            ),
-            (
-                "`` `Space` ``",
-                [code_block_parser.CodeBlock(start=0, end=12)]
-            ),
-            (
-                "`` code block with random backticks ` ``` ` ``` ``",
-                [code_block_parser.CodeBlock(start=0, end=49)]
-            ),
-            (
-                "stray backtick ` and a ``code block`` and another stray ```",
-                [code_block_parser.CodeBlock(start=23, end=36)]
-            ),
-        ):
-            parser = code_block_parser.CodeBlockParser()
-            assert parser.parse(line) == expected, line
-            assert not parser.in_multiline
+            },
+            {"line": "``block-o``", "blocks": [code_block_parser.CodeBlock(start=0, end=10)]},
+            {"line": "`` `Space` ``", "blocks": [code_block_parser.CodeBlock(start=0, end=12)]},
+            {
+                "line": "`` code block with random backticks ` ``` ` ``` ``",
+                "blocks": [code_block_parser.CodeBlock(start=0, end=49)]
+            },
+            {
+                "line": "stray backtick ` and a ``code block`` and another stray ```",
+                "blocks": [code_block_parser.CodeBlock(start=23, end=36)]
+            },
+        ]
+    )
+    def test__inline_blocks(self, payload):
+        parser = code_block_parser.CodeBlockParser()
+        assert parser.parse(payload["line"]) == payload["blocks"]
+        assert not parser.in_multiline
 
     def test__multiline_blocks(self):
         lines = [
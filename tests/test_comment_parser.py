@@ -1,23 +1,25 @@
+import pytest
+
 from wikitools import comment_parser
 
 
 class TestCommentParser:
-    def test__inline_comments(self):
-        for line, expected in (
-            ("Empty", []),
-            (
-                "<!-- A single comment-->",
-                [comment_parser.Comment(start=0, end=23)]
-            ),
-            (
-                "<!-- Several --><!-- comments -->",
-                [
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            {"line": "Empty", "comments": []},
+            {"line": "<!-- A single comment-->", "comments": [comment_parser.Comment(start=0, end=23)]},
+            {
+                "line": "<!-- Several --><!-- comments -->",
+                "comments": [
                     comment_parser.Comment(start=0, end=15),
                     comment_parser.Comment(start=16, end=32),
                 ]
-            ),
-        ):
-            assert comment_parser.CommentParser().parse(line) == expected
+            },
+        ]
+    )
+    def test__inline_comments(self, payload):
+        assert comment_parser.CommentParser().parse(payload["line"]) == payload["comments"]
 
     def test__multiline_comments(self):
         lines = [
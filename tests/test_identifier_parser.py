@@ -4,78 +4,85 @@ from wikitools import identifier_parser
 
 
 class TestIdentifierParser:
-    def test__plain_headings(self):
-        for heading, identifier in (
-            ('# Game modifiers', None),
-            ('## Game modifiers', 'game-modifiers'),
-            ('### Game modifiers', 'game-modifiers'),
-            ('#### Game modifiers', 'game-modifiers'),
-        ):
-            assert identifier_parser.extract_identifier(heading) == (identifier, 0)
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            {"heading": '# Game modifiers', "identifier": None},
+            {"heading": '## Game modifiers', "identifier": 'game-modifiers'},
+            {"heading": '### Game modifiers', "identifier": 'game-modifiers'},
+            {"heading": '#### Game modifiers', "identifier": 'game-modifiers'},
+        ]
+    )
+    def test__plain_headings(self, payload):
+        assert identifier_parser.extract_identifier(payload["heading"]) == (payload["identifier"], 0)
 
     # this uses real-life examples
-    def test__punctuation(self):
-        for heading, identifier in (
-            (
-                "## I've forgotten my username and password!",
-                "i've-forgotten-my-username-and-password!"
-            ), (
-                "## What is this 'Bancho authentication error' I keep receiving?",
-                "what-is-this-'bancho-authentication-error'-i-keep-receiving?"
-            ), (
-                '## What is "restricted" mode, exactly?',
-                'what-is-"restricted"-mode,-exactly?'
-            ), (
-                '### Can someone make this skin from that show/game?',
-                'can-someone-make-this-skin-from-that-show/game?'
-            ),
-        ):
-            assert identifier_parser.extract_identifier(heading) == (identifier, 0)
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            {
+                "heading": "## I've forgotten my username and password!",
+                "identifier": "i've-forgotten-my-username-and-password!"
+            },
+            {
+                "heading": "## What is this 'Bancho authentication error' I keep receiving?",
+                "identifier": "what-is-this-'bancho-authentication-error'-i-keep-receiving?"
+            },
+            {
+                "heading": '## What is "restricted" mode, exactly?',
+                "identifier": 'what-is-"restricted"-mode,-exactly?'
+            },
+            {
+                "heading": '### Can someone make this skin from that show/game?',
+                "identifier": 'can-someone-make-this-skin-from-that-show/game?'
+            },
+        ]
+    )
+    def test__punctuation(self, payload):
+        assert identifier_parser.extract_identifier(payload["heading"]) == (payload["identifier"], 0)
 
     # this uses real-life examples
-    def test__escape_sequences(self):
-        for heading, identifier in (
-            (
-                r"## \[Colours\]",
-                "[colours]"
-            ), (
-                r"## Step \#1",
-                "step-#1"
-            ), (
-                r"#### Чи я можу грати на тому ком\'ютері, який osu! користувач раніше використовував?",
-                "чи-я-можу-грати-на-тому-ком'ютері,-який-osu!-користувач-раніше-використовував?"
-            ), ( # except these ones
-                r"#### A \ B",
-                r"a-\-b"
-            ), (
-                r"#### A \\ B",
-                r"a-\-b"
-            ), (
-                r"#### A \\\ B",
-                r"a-\\-b"
-            ), (
-                r"#### A \\\\ B",
-                r"a-\\-b"
-            ),
-        ):
-            assert identifier_parser.extract_identifier(heading) == (identifier, 0)
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            {"heading": r"## \[Colours\]", "identifier": "[colours]"},
+            {"heading": r"## Step \#1", "identifier": "step-#1"},
+            {
+                "heading": r"#### Чи я можу грати на тому ком\'ютері, який osu! користувач раніше використовував?",
+                "identifier": "чи-я-можу-грати-на-тому-ком'ютері,-який-osu!-користувач-раніше-використовував?"
+            },
+            # except these ones
+            {"heading": r"#### A \ B", "identifier": r"a-\-b"},
+            {"heading": r"#### A \\ B", "identifier": r"a-\-b"},
+            {"heading": r"#### A \\\ B", "identifier": r"a-\\-b"},
+            {"heading": r"#### A \\\\ B", "identifier": r"a-\\-b"},
+        ]
+    )
+    def test__escape_sequences(self, payload):
+        assert identifier_parser.extract_identifier(payload["heading"]) == (payload["identifier"], 0)
 
-    def test__figure(self):
-        for heading, identifier in (
-            ('### ![osu! icon](/wiki/shared/mode/osu.png) pippi', 'pippi'),
-            ('### Mani ![osu!mania icon](/wiki/shared/mode/mania.png) Mari', 'mani-mari'),
-            ('### osu! ![][osu!]', 'osu!'),
-        ):
-            assert identifier_parser.extract_identifier(heading) == (identifier, 0)
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            {"heading": '### ![osu! icon](/wiki/shared/mode/osu.png) pippi', "identifier": 'pippi'},
+            {"heading": '### Mani ![osu!mania icon](/wiki/shared/mode/mania.png) Mari', "identifier": 'mani-mari'},
+            {"heading": '### osu! ![][osu!]', "identifier": 'osu!'},
+        ]
+    )
+    def test__figure(self, payload):
+        assert identifier_parser.extract_identifier(payload["heading"]) == (payload["identifier"], 0)
 
-    def test__link(self):
-        for heading, identifier in (
-            ('## [accounts@example.com](mailto:accounts@example.com)', 'accounts@example.com'),
-            ('## I dare you, I [double dare you](/wiki/Say_what_again)', 'i-dare-you,-i-double-dare-you'),
-            ('## A [b](/wiki/B) c d!', 'a-b-c-d!'),
-            ('## A [wild](/wiki/B) l[ink](/wiki/Ink) appears ![abc](/img/abc.png)', 'a-wild-link-appears'),
-        ):
-            assert identifier_parser.extract_identifier(heading) == (identifier, 0)
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            {"heading": '## [accounts@example.com](mailto:accounts@example.com)', "identifier": 'accounts@example.com'},
+            {"heading": '## I dare you, I [double dare you](/wiki/Say_what_again)', "identifier": 'i-dare-you,-i-double-dare-you'},
+            {"heading": '## A [b](/wiki/B) c d!', "identifier": 'a-b-c-d!'},
+            {"heading": '## A [wild](/wiki/B) l[ink](/wiki/Ink) appears ![abc](/img/abc.png)', "identifier": 'a-wild-link-appears'},
+        ]
+    )
+    def test__link(self, payload):
+        assert identifier_parser.extract_identifier(payload["heading"]) == (payload["identifier"], 0)
 
     @pytest.mark.parametrize(
         "payload",
@@ -88,21 +95,27 @@ class TestIdentifierParser:
     def test__flag(self, payload):
         assert identifier_parser.extract_identifier(payload["heading"]) == (payload["identifier"], 0)
 
-    def test__custom(self):
-        for line, identifier, pos in (
-            ('osu! is a free-to-win game.', None, 0),
-            ('## How to play better {#get-good}', 'get-good', 24),
-            ('## osu.ppy.sh {id=website}', 'website', 18),
-            ('A regular line, but with an anchor. {id=tag}', 'tag', 40),
-            ('{id=only-identifier-here}', 'only-identifier-here', 4),
-            ('Now this is a story all about how my life got flipped. {#turned-upside-down}', 'turned-upside-down', 57),
-        ):
-            assert identifier_parser.extract_identifier(line) == (identifier, pos)
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            {"line": 'osu! is a free-to-win game.', "identifier": None, "pos": 0},
+            {"line": '## How to play better {#get-good}', "identifier": 'get-good', "pos": 24},
+            {"line": '## osu.ppy.sh {id=website}', "identifier": 'website', "pos": 18},
+            {"line": 'A regular line, but with an anchor. {id=tag}', "identifier": 'tag', "pos": 40},
+            {"line": '{id=only-identifier-here}', "identifier": 'only-identifier-here', "pos": 4},
+            {"line": 'Now this is a story all about how my life got flipped. {#turned-upside-down}', "identifier": 'turned-upside-down', "pos": 57},
+        ]
+    )
+    def test__custom(self, payload):
+        assert identifier_parser.extract_identifier(payload["line"]) == (payload["identifier"], payload["pos"])
 
-    def test__unicode(self):
-        for heading, identifier in (
-            ('### Что случится, если я нарушу правила?', 'что-случится,-если-я-нарушу-правила?'),
-            ('### 当我违反规定时会发生什么？', '当我违反规定时会发生什么？'),
-            ('### Écran des résultats', 'écran-des-résultats'),
-        ):
-            assert identifier_parser.extract_identifier(heading) == (identifier, 0)
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            {"heading": '### Что случится, если я нарушу правила?', "identifier": 'что-случится,-если-я-нарушу-правила?'},
+            {"heading": '### 当我违反规定时会发生什么？', "identifier": '当我违反规定时会发生什么？'},
+            {"heading": '### Écran des résultats', "identifier": 'écran-des-résultats'},
+        ]
+    )
+    def test__unicode(self, payload):
+        assert identifier_parser.extract_identifier(payload["heading"]) == (payload["identifier"], 0)
@@ -7,34 +7,63 @@ from wikitools import git_utils
 
 
 def create_files(root: py.path.local, *articles):
+    # many files share a directory, so create each one only once instead of ensuring it per file
+    for directory in {os.path.dirname(path) for path, _ in articles}:
+        os.makedirs(root.join(directory), exist_ok=True)
+
+    # most calls write the same few contents to many files, so each is only encoded once
+    encoded = {}
     for path, contents in articles:
-        article_folder = root.join(os.path.dirname(path))
-        article_folder.ensure(dir=1)
-        if type(contents) == bytes:
-            article_folder.join(os.path.basename(path)).write_binary(contents)
-        else:
-            article_folder.join(os.path.basename(path)).write_text(contents, encoding='utf-8')
+        if type(contents) != bytes:
+            if contents not in encoded:
+                encoded[contents] = contents.encode('utf-8')
+            contents = encoded[contents]
+        with open(root.join(path), "wb") as fd:
+            fd.write(contents)
 
 
 def stage_all_and_commit(commit_message):
     git_utils.git("add", ".")
-    git_utils.git("commit", "-m", commit_message)
+    git_utils.git("commit", "--quiet", "--no-verify", "-m", commit_message)
+
+
+# test repositories are thrown away right after, so there is no point in waiting for the disk,
+# or in running any hooks set up globally (including on commits made by the code being tested)
+DUMMY_REPO_CONFIG = """
+[user]
+\tname = John Smith
+\temail = john.smith@example.com
+[commit]
+\tgpgsign = false
+[core]
+\tfsync = none
+\tfsyncObjectFiles = false
+\thooksPath = {hooks_path}
+"""
 
 
 def set_up_dummy_repo():
-    git_utils.git("init")
-    git_utils.git("branch", "-m", "master")
-    git_utils.git("config", "user.name", "John Smith")
-    git_utils.git("config", "user.email", "john.smith@example.com")
-    git_utils.git("config", "commit.gpgsign", "false")
+    git_utils.git("-c", "init.defaultBranch=master", "init")
+    # an empty hooks directory keeps global hooks away from the outdater's own commits too, which don't pass --no-verify
+    hooks_path = os.path.abspath(os.path.join(".git", "no-hooks"))
+    os.mkdir(hooks_path)
+    # appending to the config directly saves starting git once per setting
+    with open(os.path.join(".git", "config"), "a", encoding='utf-8') as fd:
+        fd.write(DUMMY_REPO_CONFIG.format(hooks_path=hooks_path.replace("\\", "/")))
+
+
+def get_changed_files(*scope):
+    # an empty scope means the whole working tree
+    return git_utils.git("diff", "--diff-filter=d", "--name-only", "--", *scope).splitlines()
 
 
-def get_changed_files():
-    return git_utils.git("diff", "--diff-filter=d", "--name-only").splitlines()
+def count_commits():
+    return int(git_utils.git("rev-list", "--count", "HEAD"))
 
 
 def get_last_commit_hash():
-    return git_utils.git("show", "HEAD", "--pretty=format:%H", "-s")
+    # only resolves the ref, without loading and formatting the commit like `git show` does
+    return git_utils.git("rev-parse", "--verify", "HEAD").strip()
 
 
 def take(the_list, *may_contain):
@@ -1,11 +1,18 @@
 import collections
 import io
+import os
 import pathlib
-import shutil
+import sys
 import typing
 
 import yaml
 
+try:
+    # much faster, but only available if PyYAML was built with libyaml
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader  # type: ignore
+
 from wikitools import code_block_parser, link_parser, comment_parser, identifier_parser, reference_parser
 
 FRONT_MATTER_DELIMITER = '---'
@@ -14,6 +21,7 @@ TITLE_INDICATOR = '# '
 
 # Workaround to make yaml.Dumper write lists with leading indentation
 # (taken from https://github.com/yaml/pyyaml/issues/234#issuecomment-765894586)
+# The libyaml-backed CDumper ignores this override, so writing stays on the pure Python dumper
 class Dumper(yaml.Dumper):
     def increase_indent(self, flow=False, *args, **kwargs):
         return super().increase_indent(flow=flow, indentless=False)
@@ -46,8 +54,9 @@ class Article:
         identifiers: typing.Dict[str, int],
         front_matter: dict
     ):
-        self.filename = path.name
-        self.directory = str(path.parent.as_posix())
+        # many articles share the same file name, and directories are compared often when resolving links
+        self.filename = sys.intern(path.name)
+        self.directory = sys.intern(str(path.parent.as_posix()))
         self.lines = lines
         self.references = references
         self.identifiers = identifiers
@@ -59,21 +68,26 @@ class Article:
 
 
 def load_front_matter(fileobj: typing.TextIO) -> dict:
-    delimiters = 0
-    buffer = io.StringIO()
-
     offset = fileobj.tell()
+
+    # Front matter can only start on the first line, so there's no need to look any further otherwise
+    if fileobj.readline().split('#')[0].strip() != FRONT_MATTER_DELIMITER:
+        fileobj.seek(offset)
+        return dict()
+
+    closed = False
+    buffer = io.StringIO()
     for line in fileobj:
         if line.split('#')[0].strip() == FRONT_MATTER_DELIMITER:
-            delimiters += 1
-        # Stop on second delimiter, or when it's clear there won't be front matter at all
-        if delimiters == 2 or line.startswith(TITLE_INDICATOR):
+            closed = True
+        # Stop on the closing delimiter, or when it's clear there won't be front matter at all
+        if closed or line.startswith(TITLE_INDICATOR):
             break
         buffer.write(line)
     fileobj.seek(offset)
 
-    if delimiters == 2:
-        return yaml.safe_load(buffer.getvalue())
+    if closed:
+        return yaml.load(buffer.getvalue(), Loader=SafeLoader)
     return dict()
 
 
@@ -99,32 +113,58 @@ def save_front_matter(filepath: str, fm: dict):
     if not fm:
         return
 
+    buffer = io.StringIO()
+    buffer.write(FRONT_MATTER_DELIMITER + '\n')
+    buffer.write(yaml.dump(
+        fm, Dumper=Dumper, default_flow_style=False, indent=2, sort_keys=False, allow_unicode=True,
+    ))
+    buffer.write(FRONT_MATTER_DELIMITER + '\n\n')
+
+    with open(filepath, "r", encoding='utf-8') as old_file:
+        front_matter_detector = FrontMatterDetector()
+        for line in old_file:
+            # There shouldn't be anything before any front matter, so it's just assumed here
+            # There may be cases where the title is preceded by a comment or HTML tags, however
+            # Such content is preserved
+            if not front_matter_detector.in_front_matter(line) and line.strip():
+                buffer.write(line)
+                buffer.write(old_file.read())
+                break
+
+    # Write the new contents in one go, then swap them in atomically so that the article is never left half-written
     new_path = filepath + '.new'
-    with open(new_path, 'w', encoding='utf-8') as new_file:
-        new_file.write(FRONT_MATTER_DELIMITER + '\n')
-        new_file.write(yaml.dump(
-            fm, Dumper=Dumper, default_flow_style=False, indent=2, sort_keys=False, allow_unicode=True,
-        ))
-        new_file.write(FRONT_MATTER_DELIMITER + '\n\n')
-
-        with open(filepath, "r", encoding='utf-8') as old_file:
-            front_matter_detector = FrontMatterDetector()
-            for line in old_file:
-                # There shouldn't be anything before any front matter, so it's just assumed here
-                # There may be cases where the title is preceded by a comment or HTML tags, however
-                # Such content is preserved
-                if not front_matter_detector.in_front_matter(line) and line.strip():
-                    new_file.write(line)
-                    new_file.write(old_file.read())
-                    break
+    with open(new_path, 'wb') as new_file:
+        new_file.write(buffer.getvalue().encode('utf-8'))
 
-    shutil.move(new_path, filepath)
+    os.replace(new_path, filepath)
 
 
 def parse(path: typing.Union[str, pathlib.Path]) -> Article:
     """
-    Read an article line by line, extracting links, identifiers and references as we go.
+    Parse the article at `path`. See parse_string for what is extracted.
+    """
+
+    if isinstance(path, str):
+        path = pathlib.Path(path)
+
+    return parse_uncached(path)
+
+
+def parse_uncached(path: pathlib.Path) -> Article:
+    """
+    Read an article from disk and parse it.
+    """
+
+    with path.open('r', encoding='utf-8') as fd:
+        return parse_string(path, fd.read())
+
+
+def parse_string(path: typing.Union[str, pathlib.Path], text: str) -> Article:
+    """
+    Parse an article line by line, extracting links, identifiers and references as we go.
     Anything inside <!-- HTML comments -->, both single and multiline, is skipped.
+
+    The article's contents are taken from `text`; `path` only determines where the article is located in the repository.
     """
 
     if isinstance(path, str):
@@ -137,41 +177,48 @@ def parse(path: typing.Union[str, pathlib.Path]) -> Article:
 
     comment_reader = comment_parser.CommentParser()
     code_block_reader = code_block_parser.CodeBlockParser()
-    with path.open('r', encoding='utf-8') as fd:
-        front_matter = load_front_matter(fd)
-        for lineno, line in enumerate(fd, start=1):
-            comments = comment_reader.parse(line)
-            code_blocks = code_block_reader.parse(line)
-
-            # everything in a multiline comment or code block doesn't count
-            if comment_reader.in_multiline or code_block_reader.in_multiline:
-                continue
-
-            links_on_line = list(filter(
-                lambda l: not(
-                    l.content == '/wiki/Sitemap' or
-                    comment_parser.is_in_comment(l.start, comments) or
-                    code_block_parser.is_in_code_block(l.start, code_blocks)
-                ),
-                link_parser.find_links(line)
-            ))
-            # cache meaningful lines. in our case, lines with links and references
-            if links_on_line:
-                saved_lines[lineno] = ArticleLine(raw_line=line, links=links_on_line)
+    fd = io.StringIO(text)
+    front_matter = load_front_matter(fd)
+
+    # most articles have no comments at all, in which case the comment parser has nothing to track
+    has_comments = '<!--' in text
+    for lineno, line in enumerate(fd, start=1):
+        comments = comment_reader.parse(line) if has_comments else []
+        code_blocks = code_block_reader.parse(line)
+
+        # everything in a multiline comment or code block doesn't count
+        if comment_reader.in_multiline or code_block_reader.in_multiline:
+            continue
+
+        links_on_line = list(filter(
+            lambda l: not(
+                l.content == '/wiki/Sitemap' or
+                comment_parser.is_in_comment(l.start, comments) or
+                code_block_parser.is_in_code_block(l.start, code_blocks)
+            ),
+            link_parser.find_links(line)
+        ))
+        # cache meaningful lines. in our case, lines with links and references
+        if links_on_line:
+            saved_lines[lineno] = ArticleLine(raw_line=line, links=links_on_line)
 
+        # only headings and identifier tags can produce identifiers; skip scanning any other line
+        if line.startswith('#') or '{' in line:
             identifier, pos = identifier_parser.extract_identifier(line, links_on_line)
-            # if a comment contains identifiers, this assumes such a comment at least
-            # doesn't appear before an actual identifier. this is a rare occurrence anyway
-            if identifier is not None and not comment_parser.is_in_comment(pos, comments):
-                    cnt[identifier] += 1
-                    # duplicate identifiers get a suffix
-                    if identifier in identifiers:
-                        identifier = '{}.{}'.format(identifier, cnt[identifier] - 1)
-                    identifiers[identifier] = lineno
-
-            if line.startswith('['):
-                reference = reference_parser.extract(line.strip(), lineno=lineno)
-                if reference is not None:
-                    references[reference.name] = reference
+        else:
+            identifier, pos = None, 0
+        # if a comment contains identifiers, this assumes such a comment at least
+        # doesn't appear before an actual identifier. this is a rare occurrence anyway
+        if identifier is not None and not comment_parser.is_in_comment(pos, comments):
+                cnt[identifier] += 1
+                # duplicate identifiers get a suffix
+                if identifier in identifiers:
+                    identifier = '{}.{}'.format(identifier, cnt[identifier] - 1)
+                identifiers[identifier] = lineno
+
+        if line.startswith('['):
+            reference = reference_parser.extract(line.strip(), lineno=lineno)
+            if reference is not None:
+                references[reference.name] = reference
 
     return Article(path, saved_lines, references, identifiers, front_matter)
@@ -37,6 +37,10 @@ class CodeBlock(typing.NamedTuple):
         return self.is_multiline or (self.start < pos and self.end > pos)
 
 
+# a run of backticks, which may open or close an inline code block
+TAG_REGEX = re.compile('`+')
+
+
 class CodeBlockParser:
     def __init__(self):
         self.__in_multiline = False
@@ -71,27 +75,22 @@ class CodeBlockParser:
         if self.__in_multiline:
             return [CodeBlock(start=-1, end=-1)]
 
+        # only backtick runs matter for inline blocks, so find all of them at once
+        tags = [(match.start(), match.end() - match.start()) for match in TAG_REGEX.finditer(line)]
         i = 0
-        while i < len(line):
-            if line[i] != '`':
-                i += 1
-                continue
-
-            tag_len = self.count_tag_length(line, i)
+        while i < len(tags):
+            start, tag_len = tags[i]
 
             # the next tag of the same length will close the block
-            closing_tag = re.search(
-                    f"(?<!`){'`' * tag_len}(?!`)",
-                    line[i + tag_len:]
-            )
-
-            if closing_tag:
-                closing_tag_pos = closing_tag.start() + i + tag_len
-                blocks.append(CodeBlock(start=i, end=closing_tag_pos + tag_len - 1))
-                i = closing_tag_pos + tag_len
+            closing = next((j for j in range(i + 1, len(tags)) if tags[j][1] == tag_len), None)
+
+            if closing is not None:
+                closing_tag_pos = tags[closing][0]
+                blocks.append(CodeBlock(start=start, end=closing_tag_pos + tag_len - 1))
+                i = closing + 1
             else:
                 # the tag wasn't closed, but there could be more code blocks
-                i += tag_len
+                i += 1
 
         return blocks
 
@@ -30,7 +30,11 @@ Useful for looking up file paths case-insensitively on case-sensitive file syste
 def file_tree():
     # this cache would only become invalid when the current working directory changes, which only happens in tests and not during normal execution
     if not hasattr(file_tree, "cache"):
-        tree = {normalised(article_path.lower()): normalised(article_path) for article_path in itertools.chain(list_all_dirs(["."]), list_all_files(["."]))}
+        # directories and files are collected in the same pass over the repository
+        tree = {}
+        for directory, files in walk("."):
+            for path in itertools.chain((directory,), (entry.path for entry in files)):
+                tree[normalised(path.lower())] = normalised(path)
         setattr(file_tree, "cache", tree)
     return getattr(file_tree, "cache")
 
@@ -106,12 +110,45 @@ def is_original(path: str) -> bool:
     return os.path.basename(path) == "en.md"
 
 
+def walk(top: str) -> typing.Generator[typing.Tuple[str, typing.List[os.DirEntry[str]]], None, None]:
+    """
+    A leaner os.walk: yields every directory, top-down, along with the entries of the files inside it.
+
+    As with os.walk, symlinked directories are not descended into, and directories that can't be read are skipped.
+    """
+
+    stack = [top]
+    while stack:
+        directory = stack.pop()
+        try:
+            entries = os.scandir(directory)
+        except OSError:
+            continue
+
+        files = []
+        subdirectories = []
+        with entries:
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+
+                if not is_dir:
+                    files.append(entry)
+                elif not entry.is_symlink():
+                    subdirectories.append(entry.path)
+
+        yield directory, files
+        # reversed, so that subdirectories are visited in the order they were listed
+        stack.extend(reversed(subdirectories))
+
+
 def list_all_files(roots: typing.Iterable[str]=["wiki"]) -> typing.Generator[str, None, None]:
     for item in roots:
-        for root, _, filenames in os.walk(item):
-            for f in filenames:
-                filepath = os.path.join(root, f).replace("\\", "/")
-                yield filepath
+        for _, files in walk(item):
+            for entry in files:
+                yield entry.path.replace("\\", "/")
 
 
 def list_all_dirs(roots: typing.Iterable[str]=["wiki"]) -> typing.Generator[str, None, None]:
@@ -120,7 +157,7 @@ def list_all_dirs(roots: typing.Iterable[str]=["wiki"]) -> typing.Generator[str,
     """
 
     for item in roots:
-        for root, _, __ in os.walk(item):
+        for root, _ in walk(item):
             yield root.replace("\\", "/")
 
 
@@ -129,8 +166,8 @@ def list_all_article_dirs() -> typing.Generator[str, None, None]:
     List ALL article directories in the wiki
     """
 
-    for root, _, filenames in os.walk("wiki"):
-        if any(is_article(f) for f in filenames):
+    for root, files in walk("wiki"):
+        if any(is_article(entry.name) for entry in files):
             yield root.replace("\\", "/")
 
 
@@ -139,9 +176,11 @@ def list_all_articles() -> typing.Generator[str, None, None]:
     List ALL article files in the wiki
     """
 
-    for filepath in list_all_files(["wiki"]):
-        if is_article(filepath):
-            yield filepath.replace("\\", "/")
+    for _, files in walk("wiki"):
+        for entry in files:
+            # the walker already knows each file's name, so there's no need to split it off the path
+            if is_article(entry.name):
+                yield entry.path.replace("\\", "/")
 
 
 def list_all_newsposts() -> typing.Generator[str, None, None]:
@@ -151,7 +190,7 @@ def list_all_newsposts() -> typing.Generator[str, None, None]:
 
     for filepath in list_all_files(["news"]):
         if is_newspost(filepath):
-            yield filepath.replace("\\", "/")
+            yield filepath
 
 
 def list_all_articles_and_newsposts() -> typing.Generator[str, None, None]:
@@ -159,9 +198,8 @@ def list_all_articles_and_newsposts() -> typing.Generator[str, None, None]:
     List ALL article and newspost files 
     """
 
-    for filepath in list_all_files(["wiki", "news"]):
-        if is_article(filepath) or is_newspost(filepath):
-            yield filepath.replace("\\", "/")
+    yield from list_all_articles()
+    yield from list_all_newsposts()
 
 
 def list_all_translations(article_dirs: typing.Iterable[str]) -> typing.Generator[str, None, None]:
@@ -170,7 +208,11 @@ def list_all_translations(article_dirs: typing.Iterable[str]) -> typing.Generato
     """
 
     for d in article_dirs:
-        for filename in sorted(os.listdir(d)):
+        # only the given directories are listed; scandir also tells files apart without an extra stat call per entry
+        with os.scandir(d) as entries:
+            filenames = sorted(entry.name for entry in entries if entry.is_file())
+
+        for filename in filenames:
             if is_original(filename) or not is_article(filename):
                 continue
 
@@ -20,8 +20,9 @@ def git(*args, expected_code=0):
 
 
 def git_diff(*file_paths, base_commit=""):
-    res = git("diff", "--diff-filter=d", "--name-only", base_commit, "--", *file_paths)
-    return res.splitlines()
+    # -z keeps paths with non-ASCII characters as they are, instead of quoting and escaping them
+    res = git("diff", "--diff-filter=d", "--name-only", "--no-renames", "-z", base_commit, "--", *file_paths)
+    return [path for path in res.split("\0") if path]
 
 
 def get_first_branch_commit():
@@ -9,20 +9,15 @@ ESCAPEABLE_CHARS = { '\\', '(' , ')', '[', ']', '{', '}', '<', '>', '#', '*', '~
 
 CONTAINER_REGEX = re.compile(r"::{.*?}::")
 
+# {#identifier} or {id=identifier}, up to the first closing brace
+IDENTIFIER_TAG_REGEX = re.compile(r"{(?:" + "|".join(map(re.escape, sorted(ID_PREFIXES))) + r")([^}]*)}")
+
+ESCAPE_SEQUENCE_REGEX = re.compile(r"\\([" + re.escape("".join(sorted(ESCAPEABLE_CHARS))) + r"])")
+
 
 # backslashes are sometimes used (perhaps unnecessarily) to avoid remark errors
 def unescape(s: str) -> str:
-    unescaped = ""
-    i = 0
-    while i < len(s):
-        if s[i] == '\\' and i < len(s) - 1 and s[i + 1] in ESCAPEABLE_CHARS:
-            unescaped += s[i + 1]
-            i += 2
-        else:
-            unescaped += s[i]
-            i += 1
-
-    return unescaped
+    return ESCAPE_SEQUENCE_REGEX.sub(r"\1", s)
 
 
 def extract_identifier(
@@ -37,20 +32,9 @@ def extract_identifier(
     The burden of checking for the comments and code blocks lies on the caller.
     """
 
-    for i in range(len(s)):
-        if s[i] == '{':
-            # could be an identifier -- check if there are any meaningful prefixes ahead
-            id_start = None
-            for prefix in ID_PREFIXES:
-                id_start = i + 1 + len(prefix)
-                if id_start >= len(s) or s[i + 1: id_start] != prefix:
-                    continue
-
-                j = id_start
-                while j < len(s) and s[j] != '}':
-                    j += 1
-                if j < len(s) and s[j] == '}':
-                    return (s[id_start: j], id_start)
+    tag = IDENTIFIER_TAG_REGEX.search(s)
+    if tag:
+        return (tag.group(1), tag.start(1))
 
     # skip regular lines and article titles (no one refers to them)
     if not s.startswith('#') or s.startswith('# '):
@@ -80,10 +64,14 @@ def extract_identifier(
             if k == len(links_on_line) - 1:
                 heading += s[start:]
 
-    identifier = "-".join(word.lower() for word in unescape(heading).strip().split())
+    # lowercasing never adds or removes whitespace, so the whole heading can be lowercased at once
+    # (split() without arguments already ignores leading and trailing whitespace)
+    identifier = "-".join(unescape(heading).lower().split())
 
     # headings can contain custom containers, such as flags
     # TODO: maybe do this in a smarter way
-    identifier = re.sub(CONTAINER_REGEX, "", identifier).strip("-")
+    if "::{" in identifier:
+        identifier = CONTAINER_REGEX.sub("", identifier)
+    identifier = identifier.strip("-")
 
     return (identifier, 0)
@@ -139,6 +139,11 @@ def find_link(s: str, index=0) -> typing.Optional[Link]:
         - [alt_text][reference], with exact locations found separately via find_reference()
     """
 
+    # nothing can happen before the first opening bracket, so skip straight to it
+    index = s.find('[', index)
+    if index == -1:
+        return None
+
     state = State.IDLE
 
     start = -1
@@ -197,7 +202,7 @@ def find_link(s: str, index=0) -> typing.Optional[Link]:
                 raw_location = s[location: extra]
                 return Link(
                     raw_location=raw_location,
-                    parsed_location=parse.urlparse(raw_location),
+                    parsed_location=reference_parser.parse_location(raw_location),
                     alt_text=s[start + 1: location - 2],
                     title=s[extra: end],
                     start=start,
@@ -213,7 +218,7 @@ def find_link(s: str, index=0) -> typing.Optional[Link]:
                 raw_location = s[location: end]
                 return Link(
                     raw_location=raw_location,
-                    parsed_location=parse.urlparse(raw_location),
+                    parsed_location=reference_parser.parse_location(raw_location),
                     alt_text=s[start + 1: location - 2],
                     title="",
                     start=start,
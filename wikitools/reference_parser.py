@@ -1,3 +1,4 @@
+import functools
 import typing
 from urllib import parse
 
@@ -44,6 +45,15 @@ class Reference(typing.NamedTuple):
 References = typing.Dict[str, Reference]
 
 
+@functools.lru_cache(maxsize=4096)
+def parse_location(location: str) -> parse.ParseResult:
+    """
+    urllib.parse.urlparse, memoised: the same locations tend to be linked to from many articles, and the results are immutable.
+    """
+
+    return parse.urlparse(location)
+
+
 def extract(s: str, lineno) -> typing.Optional[Reference]:
     """
     Given a line, attempt to extract a reference from it (assuming it occupies the whole line). Example:
@@ -65,7 +75,7 @@ def extract(s: str, lineno) -> typing.Optional[Reference]:
         location = s[split + 2:]
         title = ""
 
-    parsed_location = parse.urlparse(location)
+    parsed_location = parse_location(location)
     return Reference(
         lineno=lineno, name=name,
         raw_location=location, parsed_location=parsed_location, title=title
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 
 import argparse
+import concurrent.futures
 import sys
 import typing
 
@@ -57,6 +58,7 @@ def parse_args(args):
     parser.add_argument("--to-sections-in-missing-translations", action='store_true', help="check section links in translations that point to articles with no available translations of the same language")
 
     parser.add_argument("--case-sensitive", action='store_true', help="check file existence case-sensitively")
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="number of processes to read articles with (by default, everything is done in a single process)")
 
     parser.add_argument("-r", "--root", help="specify repository root, current working directory assumed otherwise")
     return parser.parse_args(args)
@@ -86,6 +88,15 @@ def filter_errors(
     }
 
 
+def parse_articles(filenames: typing.Iterable[str], jobs: int) -> typing.Iterable[article_parser.Article]:
+    # articles are parsed independently of each other, which makes this the only easily parallelised step
+    if jobs <= 1:
+        return map(article_parser.parse, filenames)
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as executor:
+        return list(executor.map(article_parser.parse, filenames, chunksize=64))
+
+
 def main(*args):
     args = parse_args(args)
     if not args.target and not args.all:
@@ -105,8 +116,7 @@ def main(*args):
     exit_code = 0
 
     articles = {}
-    for filename in filenames:
-        a = article_parser.parse(filename)
+    for a in parse_articles(filenames, args.jobs):
         articles[a.path] = a
 
     error_count = 0
@@ -10,7 +10,7 @@ import yamllint.config  # type: ignore
 import yamllint.linter  # type: ignore
 import yamllint.rules  # type: ignore
 
-from wikitools import console
+from wikitools import console, file_utils
 from wikitools import yaml_rules
 
 FRONT_MATTER_DELIMITER = "---"
@@ -53,9 +53,9 @@ def read_yaml(filepath: str):
 def file_iterator(roots: list, config: yamllint.config.YamlLintConfig):
     for item in roots:
         if os.path.isdir(item):
-            for root, _, filenames in os.walk(item):
-                for f in filenames:
-                    filepath = os.path.join(root, f)
+            for _, files in file_utils.walk(item):
+                for entry in files:
+                    filepath = entry.path
                     if (
                         not config.is_file_ignored(filepath) and
                         (config.is_yaml_file(filepath) or filepath.endswith(MARKDOWN_EXTENSION))
@@ -5,27 +5,27 @@ Tools useful for osu! wiki contributors
 """
 
 import argparse
+import importlib
 import sys
 
-from wikitools_cli.commands import check_outdated_articles, check_links, check_yaml
-
 from wikitools_cli.VERSION import VERSION
 
+# commands are only imported when run, so that e.g. check-links doesn't have to load yamllint
 commands = [
     {
         "name": "check-outdated-articles",
         "help": "check if articles are correctly outdated",
-        "entry": check_outdated_articles.main,
+        "module": "wikitools_cli.commands.check_outdated_articles",
     },
     {
         "name": "check-links",
         "help": "find broken wikilinks",
-        "entry": check_links.main,
+        "module": "wikitools_cli.commands.check_links",
     },
     {
         "name": "check-yaml",
         "help": "validate front matter and standalone YAML files",
-        "entry": check_yaml.main,
+        "module": "wikitools_cli.commands.check_yaml",
     },
 ]
 
@@ -53,7 +53,7 @@ def parse_args(args):
     subparsers = parser.add_subparsers(title="commands", metavar="command")
     for command in commands:
         subparser = subparsers.add_parser(command["name"], help=command["help"], add_help=False)
-        subparser.set_defaults(func=command["entry"])
+        subparser.set_defaults(module=command["module"])
 
     # any parameters after the command name are validated in the command's respective file
     # this main parser would error on them as unrecognised, so they're cut away here
@@ -70,7 +70,8 @@ def parse_args(args):
 
 def main(*args):
     parsed_args, subcommand_args = parse_args(args)
-    return parsed_args.func(*subcommand_args)
+    command = importlib.import_module(parsed_args.module)
+    return command.main(*subcommand_args)
 
 
 def console_main():